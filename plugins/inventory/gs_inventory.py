@@ -177,6 +177,7 @@ from ansible.parsing.dataloader import DataLoader
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 from ansible.utils.vars import combine_vars
 
+from ..module_utils.server import ServerRecord
 from ..module_utils.version import compare_version
 
 try:
@@ -236,23 +237,25 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             # raise AnsibleError('Invalid gridscale API credentials.') from e
             raise AnsibleError(f"Invalid gridscale API credentials: {to_native(e)}")
 
-    def _filter_servers(self, servers: list[dict]) -> list[dict]:
+    def _filter_servers(self, servers: list[ServerRecord]) -> list[ServerRecord]:
         # Filter servers by location and status
         if locations := self.get_option("locations_filter"):
-            servers = [s for s in servers if s["location_name"] in locations]
+            servers = [s for s in servers if s.location in locations]
         if status := self.get_option("status_filter"):
-            servers = [s for s in servers if s["status"] in status]
+            servers = [s for s in servers if s.status in status]
         return servers
 
-    def _fetch_servers(self) -> list[dict]:
+    def _fetch_servers(self) -> list[ServerRecord]:
         # Configure the client to connect gridscale API.
         self._configure_gridscale_client()
-        # Fetch servers
-        servers = list(self._servers.get("servers", {}).values())
+        # Fetch servers and keep only the fields we use.
+        servers = [ServerRecord.from_api(s) for s in self._servers.get("servers", {}).values()]
+        # Release the raw API response.
+        self._servers = None
         servers = self._filter_servers(servers)
         return servers
 
-    def _populate(self, servers: list[dict]) -> None:
+    def _populate(self, servers: list[ServerRecord]) -> None:
         # Add a top group
         if main_group := self.get_option("main_group"):
             self.inventory.add_group(group=main_group)
@@ -263,15 +266,15 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         hostvars_suffix = self.get_option("hostvars_suffix")
         strict = self.get_option("strict")
         for s in servers:
-            public_ips: list[str] = [ip["ip"] for ip in s["relations"]["public_ips"]]
+            public_ips = s.public_ips
             host_vars = {
-                "uuid": s["object_uuid"],
-                "hostname": s["name"],
-                "location": s["location_name"],
-                "labels": s["labels"],
-                "status": s["status"],
+                "uuid": s.uuid,
+                "hostname": s.name,
+                "location": s.location,
+                "labels": s.labels,
+                "status": s.status,
                 "public_ips": public_ips,
-                "ansible_host": public_ips[0] if public_ips else s["name"],
+                "ansible_host": public_ips[0] if public_ips else s.name,
             }
             if hostname_template:
                 templar = self.templar
@@ -280,7 +283,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                 host_vars.update(
                     {
                         "hostname": hostname,
-                        "hostname_remote": s["name"],
+                        "hostname_remote": s.name,
                     }
                 )
 
@@ -374,15 +377,18 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         cache_needs_update = user_cache_setting and not cache
         if attempt_to_read_cache:
             try:
-                servers = self._cache[cache_key]
+                servers = [ServerRecord.from_cache(s) for s in self._cache[cache_key]]
             except KeyError:
                 # This occurs if the cache_key is not in the cache or if the cache_key expired, so the cache needs to be updated.
                 cache_needs_update = True
+            except ValueError:
+                # This occurs if the cache was written in an older format, so the cache needs to be updated.
+                cache_needs_update = True
 
         if not attempt_to_read_cache or cache_needs_update:
             servers = self._fetch_servers()
         if cache_needs_update:
-            self._cache[cache_key] = servers
+            self._cache[cache_key] = [s.to_cache() for s in servers]
 
         # Populate the inventory
         self._populate(servers)
@@ -0,0 +1,70 @@
+from sys import intern
+
+
+class ServerRecord:
+    """A server with only the fields the inventory plugin uses.
+
+    Records are built once from the API response via `from_api` and passed through
+    filtering, caching and populating. Location and status values repeat across servers,
+    so they are interned to share a single string object.
+    """
+
+    __slots__ = ("uuid", "name", "location", "status", "labels", "public_ips")
+
+    def __init__(
+        self,
+        uuid: str,
+        name: str,
+        location: str | None,
+        status: str | None,
+        labels: list[str],
+        public_ips: list[str],
+    ) -> None:
+        self.uuid = uuid
+        self.name = name
+        self.location = intern(location) if location is not None else None
+        self.status = intern(status) if status is not None else None
+        self.labels = labels
+        self.public_ips = public_ips
+
+    @classmethod
+    def from_api(cls, server: dict) -> "ServerRecord":
+        # Every server is converted before filtering, so tolerate missing fields.
+        return cls(
+            server["object_uuid"],
+            server["name"],
+            server.get("location_name"),
+            server.get("status"),
+            server.get("labels") or [],
+            [ip["ip"] for ip in (server.get("relations") or {}).get("public_ips") or []],
+        )
+
+    @classmethod
+    def from_cache(cls, data: list) -> "ServerRecord":
+        # Records are cached as lists in `__slots__` order.
+        if not isinstance(data, list | tuple) or len(data) != len(cls.__slots__):
+            raise ValueError(f"Invalid cached server record: {data!r}")
+        uuid, name, location, status, labels, public_ips = data
+        if (
+            not isinstance(uuid, str)
+            or not isinstance(name, str)
+            or not isinstance(location, str | None)
+            or not isinstance(status, str | None)
+            or not isinstance(labels, list)
+            or not isinstance(public_ips, list)
+        ):
+            raise ValueError(f"Invalid cached server record: {data!r}")
+        return cls(*data)
+
+    def to_cache(self) -> list:
+        return [getattr(self, k) for k in self.__slots__]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ServerRecord):
+            return NotImplemented
+        return self.to_cache() == other.to_cache()
+
+    def __repr__(self) -> str:
+        return (
+            f"ServerRecord(uuid={self.uuid!r}, name={self.name!r}, location={self.location!r}, status={self.status!r})"
+        )
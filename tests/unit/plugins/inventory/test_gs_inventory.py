@@ -6,6 +6,7 @@ from ansible.inventory.data import InventoryData
 from ansible.parsing.dataloader import DataLoader
 from ansible.template import Templar
 from ansible_collections.unbyte.gridscale.plugins.inventory.gs_inventory import InventoryModule
+from ansible_collections.unbyte.gridscale.plugins.module_utils.server import ServerRecord
 
 
 @pytest.fixture(scope="module")
@@ -94,11 +95,79 @@ def test_fetch_servers(inventory, mocker, input_file, options, expected_file):
     servers = inventory._fetch_servers()
     # Read expected result from file
     with open(Path(__file__).parent.joinpath(f"files/test_fetch_servers/{expected_file}")) as f:
-        servers_expected = json.load(f)
+        servers_expected = [ServerRecord.from_api(s) for s in json.load(f)]
     # Compare
     assert servers == servers_expected
 
 
+def read_servers(input_file):
+    with open(Path(__file__).parent.joinpath(f"files/test_fetch_servers/{input_file}")) as f:
+        return [ServerRecord.from_api(s) for s in json.load(f)]
+
+
+def test_parse_cache_hit(inventory, mocker):
+    servers = read_servers("servers_expected_all.json")
+    mocker.patch.object(inventory, "_read_config_data")
+    mocker.patch.object(inventory, "get_cache_key", return_value="cache_key")
+    mocker.patch.object(inventory, "get_option", side_effect=get_option({"cache": True}))
+    mocker.patch.object(inventory, "_cache", {"cache_key": [s.to_cache() for s in servers]}, create=True)
+    fetch_servers = mocker.patch.object(inventory, "_fetch_servers")
+    populate = mocker.patch.object(inventory, "_populate")
+
+    inventory.parse(InventoryData(), inventory.loader, "test.gs_inventory.yaml", cache=True)
+
+    fetch_servers.assert_not_called()
+    populate.assert_called_once_with(servers)
+
+
+@pytest.mark.parametrize(
+    "cached",
+    [
+        # Cache written in the old format with raw API dicts.
+        "servers_expected_all.json",
+        # Corrupt cache entry with the right length but wrong field types.
+        None,
+    ],
+)
+def test_parse_cache_invalid(inventory, mocker, cached):
+    servers = read_servers("servers_expected_all.json")
+    if cached:
+        with open(Path(__file__).parent.joinpath(f"files/test_fetch_servers/{cached}")) as f:
+            cache = {"cache_key": json.load(f)}
+    else:
+        cache = {"cache_key": [["uuid", "name", 1, 2, None, None]]}
+    mocker.patch.object(inventory, "_read_config_data")
+    mocker.patch.object(inventory, "get_cache_key", return_value="cache_key")
+    mocker.patch.object(inventory, "get_option", side_effect=get_option({"cache": True}))
+    mocker.patch.object(inventory, "_cache", cache, create=True)
+    fetch_servers = mocker.patch.object(inventory, "_fetch_servers", return_value=servers)
+    populate = mocker.patch.object(inventory, "_populate")
+
+    inventory.parse(InventoryData(), inventory.loader, "test.gs_inventory.yaml", cache=True)
+
+    fetch_servers.assert_called_once()
+    assert cache["cache_key"] == [s.to_cache() for s in servers]
+    populate.assert_called_once_with(servers)
+
+
+def test_parse_cache_refresh(inventory, mocker):
+    servers = read_servers("servers_expected_all.json")
+    cache = {"cache_key": [s.to_cache() for s in read_servers("servers_expected_one.json")]}
+    mocker.patch.object(inventory, "_read_config_data")
+    mocker.patch.object(inventory, "get_cache_key", return_value="cache_key")
+    mocker.patch.object(inventory, "get_option", side_effect=get_option({"cache": True}))
+    mocker.patch.object(inventory, "_cache", cache, create=True)
+    fetch_servers = mocker.patch.object(inventory, "_fetch_servers", return_value=servers)
+    populate = mocker.patch.object(inventory, "_populate")
+
+    # `cache=False` means the inventory is being refreshed (e.g. with --flush-cache).
+    inventory.parse(InventoryData(), inventory.loader, "test.gs_inventory.yaml", cache=False)
+
+    fetch_servers.assert_called_once()
+    assert cache["cache_key"] == [s.to_cache() for s in servers]
+    populate.assert_called_once_with(servers)
+
+
 @pytest.mark.parametrize(
     "input_file, options, expected_file",
     [
@@ -163,7 +232,7 @@ def test_fetch_servers(inventory, mocker, input_file, options, expected_file):
 )
 def test_populate(inventory, mocker, input_file, options, expected_file):
     with open(Path(__file__).parent.joinpath(f"files/test_populate/{input_file}")) as f:
-        servers = json.load(f)
+        servers = [ServerRecord.from_api(s) for s in json.load(f)]
 
     inventory.get_option = mocker.Mock(side_effect=get_option(options))
 
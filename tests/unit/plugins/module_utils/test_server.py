@@ -0,0 +1,67 @@
+import pytest
+from ansible_collections.unbyte.gridscale.plugins.module_utils.server import ServerRecord
+
+SERVER = {
+    "labels": ["test-label"],
+    "location_name": "de/fra",
+    "location_uuid": "7f5016dd-d1b2-4db7-bb3c-35ab5bb63357",
+    "name": "k8s-dev-master-0",
+    "object_uuid": "b9abb4ba-a1ea-4eba-a8ed-d03cb21f12ee",
+    "status": "active",
+    "relations": {
+        "storages": [{"object_uuid": "272778aa-2f0c-4e26-82fc-dddb1928590b"}],
+        "public_ips": [
+            {"object_uuid": "326ebe35-4dc6-46ba-932e-44ded4efa27c", "ip": "185.102.11.11"},
+            {"object_uuid": "f137f19b-c631-47af-81e4-0bb50aa81666", "ip": "2a06:2380:0:1::11"},
+        ],
+    },
+}
+
+
+def test_from_api():
+    s = ServerRecord.from_api(SERVER)
+    assert s.uuid == "b9abb4ba-a1ea-4eba-a8ed-d03cb21f12ee"
+    assert s.name == "k8s-dev-master-0"
+    assert s.location == "de/fra"
+    assert s.status == "active"
+    assert s.labels == ["test-label"]
+    assert s.public_ips == ["185.102.11.11", "2a06:2380:0:1::11"]
+    assert not hasattr(s, "__dict__")
+
+
+def test_from_api_interns_strings():
+    s1 = ServerRecord.from_api(SERVER)
+    s2 = ServerRecord.from_api(SERVER | {"location_name": "".join(["de/", "fra"]), "status": "".join(["act", "ive"])})
+    assert s1.location is s2.location
+    assert s1.status is s2.status
+
+
+def test_cache_roundtrip():
+    s = ServerRecord.from_api(SERVER)
+    assert ServerRecord.from_cache(s.to_cache()) == s
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        SERVER,
+        [],
+        ["b9abb4ba-a1ea-4eba-a8ed-d03cb21f12ee", "k8s-dev-master-0"],
+        ["b9abb4ba-a1ea-4eba-a8ed-d03cb21f12ee", "k8s-dev-master-0", 1, "active", [], []],
+        ["b9abb4ba-a1ea-4eba-a8ed-d03cb21f12ee", "k8s-dev-master-0", "de/fra", ["active"], [], []],
+        ["b9abb4ba-a1ea-4eba-a8ed-d03cb21f12ee", "k8s-dev-master-0", "de/fra", "active", None, []],
+    ],
+)
+def test_from_cache_exception(data):
+    with pytest.raises(ValueError):
+        ServerRecord.from_cache(data)
+
+
+def test_from_api_missing_fields():
+    s = ServerRecord.from_api(
+        {"object_uuid": "b9abb4ba-a1ea-4eba-a8ed-d03cb21f12ee", "name": "k8s-dev-master-0", "location_name": None}
+    )
+    assert s.location is None
+    assert s.status is None
+    assert s.labels == []
+    assert s.public_ips == []